@@ -10,4 +10,5 @@ except DistributionNotFound:
 finally:
     del get_distribution, DistributionNotFound
 
-from video_metadata.video_metadata import VideoMetadata, YOUTUBE_API_SERVICE_NAME, YOUTUBE_API_VERSION
\ No newline at end of file
+from video_metadata.video_metadata import VideoMetadata, YOUTUBE_API_SERVICE_NAME, YOUTUBE_API_VERSION, afetch, preload, \
+    clear_cache, configure_cache
\ No newline at end of file
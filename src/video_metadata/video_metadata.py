@@ -1,8 +1,275 @@
-from googleapiclient.discovery import build
+import asyncio
+import functools
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build_from_document
+from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http, set_user_agent
+from googleapiclient.model import JsonModel
 import googleapiclient
-from typing import Union, Optional, List, Tuple, Iterator
+import httplib2
+from video_metadata import __version__
+from typing import Union, Optional, List, Tuple, Iterator, Dict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
 YOUTUBE_API_SERVICE_NAME = "youtube"
 YOUTUBE_API_VERSION = "v3"
+# googleapiclient already sends `Accept-Encoding: gzip` and appends "(gzip)" to this,
+# which Google requires before it compresses responses.
+_USER_AGENT = "video_metadata/{}".format(__version__)
+# Only the snippet is read, each extra part costs quota and server work
+_PART = "snippet"
+_FIELDS = "items(id, snippet(categoryId,channelId,channelTitle,defaultAudioLanguage,defaultLanguage,description,liveBroadcastContent,publishedAt,tags,title))"
+# Most video ids the API accepts in a single `videos().list` call
+_MAX_IDS_PER_REQUEST = 50
+# Most calls googleapiclient allows in a single batch request
+_MAX_REQUESTS_PER_BATCH = 1000
+
+# Read-only and shared by every instance, so lookups skip the class attribute lookup
+_CATEGORY_ID_TO_NAME = MappingProxyType({"1": "Film & Animation",
+                                         "2": "Autos & Vehicles",
+                                         "10": "Music",
+                                         "15": "Pets & Animals",
+                                         "17": "Sports",
+                                         "18": "ShortMovies",
+                                         "19": "Travel & Events",
+                                         "20": "Gaming",
+                                         "21": "Videoblogging",
+                                         "22": "People & Blogs",
+                                         "23": "Comedy",
+                                         "24": "Entertainment",
+                                         "25": "News & Politics",
+                                         "26": "Howto & Style",
+                                         "27": "Education",
+                                         "28": "Science & Technology",
+                                         "29": "Nonprofits & Activism",
+                                         "30": "Movies",
+                                         "31": "Anime/Animation",
+                                         "32": "Action/Adventure",
+                                         "33": "Classics",
+                                         "34": "Comedy",
+                                         "35": "Documentary",
+                                         "36": "Drama",
+                                         "37": "Family",
+                                         "38": "Foreign",
+                                         "39": "Horror",
+                                         "40": "Sci-Fi/Fantasy",
+                                         "41": "Thriller",
+                                         "42": "Shorts",
+                                         "43": "Shows",
+                                         "44": "Trailers",
+                                         })
+
+# One client per dev key, shared by every VideoMetadata built from that key in any thread.
+_CLIENTS: Dict[str, googleapiclient.discovery.Resource] = {}
+_clients_lock = threading.Lock()
+
+# httplib2.Http is not thread-safe, so shared clients send their requests over the calling thread's own
+# transport. Reusing it keeps the connection alive, saving a TCP+TLS handshake per lookup.
+_transports = threading.local()
+
+
+# Parsed metadata of recently fetched videos keyed by video id, least recently used first.
+# Each entry holds the pickled metadata and the time it expires at, None for never.
+# Video metadata is public, so entries are shared regardless of the dev key that fetched them.
+# Unavailable videos are not cached since they may become available later.
+# Every hit unpickles a fresh copy, so callers mutating results never alter the cache.
+# Pickling is done outside the lock and is several times cheaper than a deepcopy.
+_response_cache_size = 4096
+_response_cache: "OrderedDict[str, Tuple[bytes, Optional[float]]]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+# Snippets rarely change, the expiry only bounds how stale an entry can get.
+_cache_expire_seconds: Optional[float] = 24 * 60 * 60
+
+# Keeps metadata on disk between runs, only when set up with `configure_cache`
+_disk_cache: Optional["diskcache.Cache"] = None
+
+
+def _response_cache_get(yt_id: str) -> Optional[dict]:
+    """Returns the cached metadata for a video id, None when it is not cached or expired
+    Entries only found on disk are kept in memory for the next lookup"""
+    frozen = None
+    with _response_cache_lock:
+        entry = _response_cache.get(yt_id)
+        if entry is not None:
+            frozen, expires_at = entry
+            if expires_at is None or time.time() < expires_at:
+                _response_cache.move_to_end(yt_id)
+            else:
+                frozen = None
+                del _response_cache[yt_id]
+    if frozen is not None:
+        return pickle.loads(frozen)
+
+    disk_cache = _disk_cache
+    if disk_cache is None:
+        return None
+    # diskcache drops expired entries itself, its expiry carries over to the memory entry
+    item, expires_at = disk_cache.get(yt_id, expire_time=True)
+    if item is not None:
+        _memory_cache_put([item], expires_at)
+    return item
+
+
+def _response_cache_put(items: List[dict]):
+    """Caches fetched video metadata in memory and, when set up, on disk"""
+    expire = _cache_expire_seconds
+    _memory_cache_put(items, None if expire is None else time.time() + expire)
+    disk_cache = _disk_cache
+    if disk_cache is not None:
+        # One transaction for all items instead of one per item
+        with disk_cache.transact():
+            for item in items:
+                disk_cache.set(item["id"], item, expire=expire)
+
+
+def _memory_cache_put(items: List[dict], expires_at: Optional[float]):
+    """Caches video metadata in memory, evicting the least recently used entries when full"""
+    if not _response_cache_size:
+        return
+    frozen = [(item["id"], pickle.dumps(item, pickle.HIGHEST_PROTOCOL)) for item in items]
+    with _response_cache_lock:
+        for yt_id, item in frozen:
+            _response_cache[yt_id] = (item, expires_at)
+            _response_cache.move_to_end(yt_id)
+        while len(_response_cache) > _response_cache_size:
+            _response_cache.popitem(last=False)
+
+
+def configure_cache(size: int = 4096,
+                    directory: Optional[str] = None,
+                    expire: Optional[float] = 24 * 60 * 60):
+    """Sets up the caches of looked up metadata. Lookups of cached videos skip the API.
+    Metadata is kept in memory. It is also kept on disk between runs only when `directory` is given,
+    e.g. "~/.cache/video_metadata", which requires diskcache.
+    :param size: Most videos kept in memory, the least recently used are evicted first. 0 disables it.
+    :param directory: Directory of the on-disk cache. None stops using the disk.
+    :param expire: Seconds metadata is cached for, None to keep it until evicted.
+    :raises: ImportError, ValueError
+    """
+    global _response_cache_size, _cache_expire_seconds, _disk_cache
+    if size < 0:
+        raise ValueError("`size` must not be negative")
+    if directory is not None and diskcache is None:
+        raise ImportError("an on-disk cache requires diskcache, install video_metadata[cache]")
+
+    with _response_cache_lock:
+        _response_cache_size = size
+        _cache_expire_seconds = expire
+        while len(_response_cache) > size:
+            _response_cache.popitem(last=False)
+
+    if _disk_cache is not None:
+        _disk_cache.close()
+    _disk_cache = None if directory is None else diskcache.Cache(os.path.expanduser(directory))
+
+
+def clear_cache():
+    """Forgets all cached metadata, in memory and on disk, so the next lookups are sent to the API"""
+    with _response_cache_lock:
+        _response_cache.clear()
+    disk_cache = _disk_cache
+    if disk_cache is not None:
+        disk_cache.clear()
+
+
+class _OrjsonModel(JsonModel):
+    """Parses response bodies with orjson, several times faster than json on large responses"""
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # JsonModel returns bodies that are not JSON as is
+            return super().deserialize(content)
+        if self._data_wrapper and "data" in body:
+            body = body["data"]
+        return body
+
+
+def _split_cached(yt_ids: List[str]) -> Tuple[Dict[str, dict], List[str]]:
+    """Returns the cached metadata by id and the ids, without duplicates, that still need a lookup"""
+    found = {}
+    for yt_id in yt_ids:
+        cached = _response_cache_get(yt_id)
+        if cached is not None:
+            found[yt_id] = cached
+    misses = [yt_id for yt_id in dict.fromkeys(yt_ids) if yt_id not in found]
+    return found, misses
+
+
+@functools.lru_cache(maxsize=None)
+def _discovery_document() -> str:
+    """The YouTube discovery document bundled with googleapiclient, read from disk once"""
+    return discovery_cache.get_static_doc(YOUTUBE_API_SERVICE_NAME, YOUTUBE_API_VERSION)
+
+
+def _new_http() -> httplib2.Http:
+    """A transport for shared clients
+    build_http keeps googleapiclient's socket timeout and YouTube's 308 handling"""
+    return set_user_agent(build_http(), _USER_AGENT)
+
+
+def _get_client(dev_key: str) -> googleapiclient.discovery.Resource:
+    """Returns the shared API client for `dev_key`, building it on first use"""
+    client = _CLIENTS.get(dev_key)
+    if client is None:
+        with _clients_lock:
+            client = _CLIENTS.get(dev_key)
+            if client is None:
+                # googleapiclient's own JsonModel is used when orjson is not installed
+                model = _OrjsonModel() if orjson else None
+                # Building from the bundled document never downloads it
+                client = _CLIENTS[dev_key] = build_from_document(_discovery_document(), developerKey=dev_key,
+                                                                 http=_new_http(), model=model)
+    return client
+
+
+def _thread_http(client: googleapiclient.discovery.Resource) -> Optional[httplib2.Http]:
+    """The calling thread's transport when `client` is shared across threads
+    None for clients given by callers, which keep using their own transport"""
+    with _clients_lock:
+        shared = any(client is shared_client for shared_client in _CLIENTS.values())
+    if not shared:
+        return None
+    http = getattr(_transports, "http", None)
+    if http is None:
+        http = _transports.http = _new_http()
+    return http
+
+
+def preload(dev_keys: List[str]):
+    """Builds the shared client of every dev key ahead of the first lookup, e.g. from Django's
+    `AppConfig.ready()` or a WSGI module:
+
+        video_metadata.preload([settings.YOUTUBE_DEV_KEY])
+
+    Every thread uses these clients, so no request pays for building one. Each thread still
+    opens its own HTTP connection on its first lookup.
+    :param dev_keys: Google Cloud Platform dev keys that VideoMetadata will be given.
+    """
+    for dev_key in dev_keys:
+        _get_client(dev_key)
 
 
 class VideoMetadata:
@@ -10,39 +277,9 @@ class VideoMetadata:
     Must check self.available when iterating for valid results
     """
 
-    _CATEGORY_ID_TO_NAME = {"1": "Film & Animation",
-                            "2": "Autos & Vehicles",
-                            "10": "Music",
-                            "15": "Pets & Animals",
-                            "17": "Sports",
-                            "18": "ShortMovies",
-                            "19": "Travel & Events",
-                            "20": "Gaming",
-                            "21": "Videoblogging",
-                            "22": "People & Blogs",
-                            "23": "Comedy",
-                            "24": "Entertainment",
-                            "25": "News & Politics",
-                            "26": "Howto & Style",
-                            "27": "Education",
-                            "28": "Science & Technology",
-                            "29": "Nonprofits & Activism",
-                            "30": "Movies",
-                            "31": "Anime/Animation",
-                            "32": "Action/Adventure",
-                            "33": "Classics",
-                            "34": "Comedy",
-                            "35": "Documentary",
-                            "36": "Drama",
-                            "37": "Family",
-                            "38": "Foreign",
-                            "39": "Horror",
-                            "40": "Sci-Fi/Fantasy",
-                            "41": "Thriller",
-                            "42": "Shorts",
-                            "43": "Shows",
-                            "44": "Trailers",
-                            }
+    # Fixed attributes keep instances small, views and copies make many of them
+    __slots__ = ("client", "requested_yt_ids", "_multi_metadata", "iter_enumerate",
+                 "_current_index", "current_item", "_current_snippet")
 
     def __init__(self,
                  video_id: Union[str, list] = '',
@@ -60,8 +297,6 @@ class VideoMetadata:
         """
         # The videos requested to lookup
         self.requested_yt_ids: List[str] = []
-        self.current_item = None
-
 
         if isinstance(video_id, str):
             self.requested_yt_ids = [video_id]
@@ -74,7 +309,7 @@ class VideoMetadata:
         if client:
             self.client = client
         elif dev_key:
-            self.client = build(YOUTUBE_API_SERVICE_NAME, YOUTUBE_API_VERSION, developerKey=dev_key)
+            self.client = _get_client(dev_key)
         else:
             raise ValueError("`video_id` and `dev_key` must be specified together")
 
@@ -84,20 +319,20 @@ class VideoMetadata:
             self._multi_metadata = []
 
         if json:
-            # Removes a double list when slicing results
             # The `items` value holds a list of video metadata results.
             # The index of that list tells the current result..
-            self._multi_metadata = [x for x in json["items"]]
+            # The list is freshly parsed, so it is kept rather than copied
+            self._multi_metadata = json["items"]
+            if not video_id:
+                # Keeps `id` in line with the results
+                self.requested_yt_ids = [item["id"] for item in self._multi_metadata]
 
         self.iter_enumerate: Iterator[Tuple[int, dict]] = iter(enumerate(self._multi_metadata, start=0))
-        self.current_index = None
+        self._select(0 if self._multi_metadata else None)
 
     def available(self) -> bool:
         """Did the API return a result that is useful?"""
-        if self.current_item:
-            return True
-        else:
-            return False
+        return self.current_item is not None
 
     def __len__(self):
         """Number of videos with metadata"""
@@ -108,22 +343,84 @@ class VideoMetadata:
         return self
 
     def __next__(self):
-        self._current_index, self.current_item = next(self.iter_enumerate)
+        index, _ = next(self.iter_enumerate)
+        self._select(index)
         return self
 
-    def __getitem__(self, item):
-        """A new instance is made containing only the results sliced
-        `items` is added back to have the same appearance as an actual api response"""
-        return self._multi_metadata[item]
-
+    def _select(self, index: Optional[int]):
+        """Makes the video at `index` of `_multi_metadata` the current video
+        No video is current when `index` is None"""
+        self._current_index = 0 if index is None else index
+        self.current_item = None if index is None else self._multi_metadata[index]
+        # Properties read fields from the snippet, so it is looked up once per video
+        self._current_snippet = (self.current_item or {}).get("snippet") or {}
+
+    def __getitem__(self, item: Union[int, slice]) -> "VideoMetadata":
+        """A view is returned holding only the results sliced
+        The view shares this instance's results, use `copy` for an independent instance"""
+        selected = self._indices()[item]
+        if isinstance(selected, int):
+            selected = range(selected, selected + 1)
+        return _VideoMetadataView(self, selected)
+
+    def _indices(self) -> range:
+        """Positions of this instance's videos within `_multi_metadata`"""
+        return range(len(self._multi_metadata))
+
+    def copy(self) -> "VideoMetadata":
+        """A new instance with its own lists of the results and requested ids"""
+        indices = self._indices()
+        return VideoMetadata._from_results(self.client,
+                                           [self.requested_yt_ids[index] for index in indices],
+                                           [self._multi_metadata[index] for index in indices])
+
+    def to_dataframe(self) -> "pandas.DataFrame":
+        """One row per video and one column per property, unavailable videos having empty values
+        Columns are built straight from the results, one pass each, instead of iterating the instance.
+        Requires pandas.
+        """
+        # Imported here since pandas is optional and slow to import
+        try:
+            import pandas
+        except ImportError:
+            raise ImportError("to_dataframe requires pandas, install video_metadata[pandas]") from None
+
+        indices = self._indices()
+        results = [self._multi_metadata[index] for index in indices]
+        snippets = [(result or {}).get("snippet") or {} for result in results]
+        category_ids = [snippet.get("categoryId", "") for snippet in snippets]
+        return pandas.DataFrame({
+            "id": [self.requested_yt_ids[index] for index in indices],
+            "available": [result is not None for result in results],
+            "title": [snippet.get("title", "") for snippet in snippets],
+            "description": [snippet.get("description", "") for snippet in snippets],
+            "channel_id": [snippet.get("channelId", "") for snippet in snippets],
+            "channel_title": [snippet.get("channelTitle", "") for snippet in snippets],
+            "keywords": [snippet.get("tags", []) for snippet in snippets],
+            "time_published": [snippet.get("publishedAt", "") for snippet in snippets],
+            "category_id": category_ids,
+            "category_name": pandas.Series(category_ids, dtype=object)
+                                   .map(_CATEGORY_ID_TO_NAME).fillna(""),
+        })
+
+    @classmethod
+    def _from_results(cls,
+                      client: googleapiclient.discovery.Resource,
+                      requested_yt_ids: List[str],
+                      results: List[Optional[dict]]) -> "VideoMetadata":
+        """An instance holding results that were already looked up, None marking unavailable videos"""
+        metadata = cls.__new__(cls)
+        metadata.client = client
+        metadata.requested_yt_ids = requested_yt_ids
+        metadata._multi_metadata = results
+        metadata.iter_enumerate = iter(enumerate(results, start=0))
+        metadata._select(0 if results else None)
+        return metadata
 
     @property
     def id(self) -> str:
         return self.requested_yt_ids[self._current_index]
 
-    def _current_video(self) -> dict:
-        return self._multi_metadata[self._current_index]
-
     @staticmethod
     def _convert_list_to_comma_string(ids: Union[str, List[str]]) -> str:
         """Converts a list of video ids to format that the youtube api needs
@@ -133,96 +430,184 @@ class VideoMetadata:
             return ids
         return ','.join(ids)
 
+    @staticmethod
+    def _chunked(ids: list, size: int) -> Iterator[list]:
+        """Splits a list into consecutive sublists of at most `size` elements"""
+        for start in range(0, len(ids), size):
+            yield ids[start:start + size]
+
+    @staticmethod
+    def _list_request(client: googleapiclient.discovery.Resource, ids: List[str]) -> googleapiclient.http.HttpRequest:
+        """Builds (without executing) the metadata lookup for at most 50 video ids"""
+        return client.videos().list(part=_PART, fields=_FIELDS, id=VideoMetadata._convert_list_to_comma_string(ids))
+
+    def _fetch(self, yt_ids: List[str]) -> List[dict]:
+        """Looks up the ids 50 at a time, sending every lookup in one batch HTTP request
+        Returns the available videos in request order"""
+        chunks = list(self._chunked(yt_ids, _MAX_IDS_PER_REQUEST))
+        http = _thread_http(self.client)
+
+        if len(chunks) == 1:
+            # A batch of one only adds multipart overhead
+            return self._list_request(self.client, chunks[0]).execute(http=http).get("items", [])
+
+        # Batch responses may arrive in any order, keep them by chunk index
+        chunk_items = {}
+
+        def collect(request_id, response, exception):
+            if exception is not None:
+                raise exception
+            chunk_items[int(request_id)] = response.get("items", [])
+
+        for batch_chunks in self._chunked(list(enumerate(chunks)), _MAX_REQUESTS_PER_BATCH):
+            batch = self.client.new_batch_http_request(callback=collect)
+            for index, chunk in batch_chunks:
+                batch.add(self._list_request(self.client, chunk), request_id=str(index))
+            batch.execute(http=http)
+        return [item for index in range(len(chunks)) for item in chunk_items[index]]
+
     def _get_video_metadata(self, yt_id: Union[List[str], str]):
-        result = self.client.videos().list(part="snippet,contentDetails,statistics",
-                                           fields="items(id, snippet(categoryId,channelId,channelTitle,defaultAudioLanguage,defaultLanguage,description,liveBroadcastContent,publishedAt,tags,title))",
-                                           id=self._convert_list_to_comma_string(yt_id)).execute()["items"]
-        self._multi_metadata = _mark_unavailable_videos(yt_id, result)
+        """Only ids missing from the response cache are requested from the API"""
+        if isinstance(yt_id, str):
+            yt_id = [yt_id]
+
+        found, misses = _split_cached(yt_id)
+        if misses:
+            fetched = self._fetch(misses)
+            _response_cache_put(fetched)
+            found.update((item["id"], item) for item in fetched)
+
+        self._multi_metadata = _mark_unavailable_videos(yt_id, list(found.values()))
         self._current_index = 0
 
     @property
     def category_id(self) -> str:
         """Returns the numeric category of the video
         Returns an empty string if no category id is present"""
-        snippet = self._current_video().get("snippet")
-        if snippet is None:
-            return ""
-        cid = snippet.get("categoryId")
-        if cid is None:
-            return ""
-        return cid
+        return self._current_snippet.get("categoryId", "")
 
     @property
     def category_name(self) -> str:
-        return self._CATEGORY_ID_TO_NAME[self.category_id]
+        """Returns the name of the video's category
+        Returns an empty string if the category is missing or unknown"""
+        return _CATEGORY_ID_TO_NAME.get(self.category_id, "")
 
     @property
     def channel_id(self) -> str:
-        try:
-            return self._current_video()["snippet"]["channelId"]
-        except KeyError:
-            return ""
+        return self._current_snippet.get("channelId", "")
 
     @property
     def channel_title(self) -> str:
-        try:
-            return self._current_video()["snippet"]["channelTitle"]
-        except KeyError:
-            return ""
+        return self._current_snippet.get("channelTitle", "")
 
     @property
     def title(self) -> str:
-        return self._current_video()["snippet"]["title"]
+        return self._current_snippet.get("title", "")
 
     @property
     def keywords(self) -> list:
         """Returns a list of keywords attached to the video
         If there are no keywords an empty list is returned."""
-        try:
-            return self._current_video()["snippet"]["tags"]
-        except KeyError:
-            return []
+        return self._current_snippet.get("tags", [])
 
     @property
     def description(self) -> str:
         """Description provided for video"""
-        return self._current_video()["snippet"]["description"]
+        return self._current_snippet.get("description", "")
 
     @property
     def time_published(self) -> str:
-        return self._current_video()["snippet"]["publishedAt"]
-
-
-def _mark_unavailable_videos(vids_requested: List, vids_result: List) -> List:
-    """Fills requests with unavailable video ids with None"""
-
-    # Control advancement of yt results because API gives no indication of which videos are missing
-    vids_request_iter = iter(vids_requested)
-    some_info = []
-
-    # No results matched for any videos requested
-    no_vid_results = len(vids_result) == 0
-    if no_vid_results:
-        # Fill with empty results
-        return [None] * len(vids_requested)
-
-    # Advance through requests to match up with the available videos returned
-    for vid_result in vids_result:
-        matches = False
-        while not matches:
-            # Get next requested yt id
-            request_yt_id = next(vids_request_iter)
-            response_yt_id = vid_result["id"]
-            if request_yt_id == response_yt_id:
-                some_info.append(vid_result)
-                # Found the matching response, move to next video response result
-                matches = True
-            else:
-                # Video not available, Mark result as so
-                some_info.append(None)
+        return self._current_snippet.get("publishedAt", "")
+
+
+class _VideoMetadataView(VideoMetadata):
+    """Videos of a VideoMetadata selected by indexing or slicing
+    Shares the lists of the instance it was sliced from and only keeps the positions selected,
+    so slicing a view again never copies results.
+    `_current_index` is a position in the shared lists rather than in the view.
+    """
+
+    __slots__ = ("_selected",)
+
+    def __init__(self, parent: VideoMetadata, selected: range):
+        self.client = parent.client
+        self.requested_yt_ids = parent.requested_yt_ids
+        self._multi_metadata = parent._multi_metadata
+        self._selected = selected
+        self.iter_enumerate = iter(selected)
+        self._select(selected[0] if selected else None)
 
-    # Any remaining requests had no responsive results
-    for _ in vids_request_iter:
-        some_info.append(None)
+    def __len__(self):
+        """Number of videos with metadata"""
+        return len(self._selected)
+
+    def __iter__(self):
+        self.iter_enumerate = iter(self._selected)
+        return self
+
+    def __next__(self):
+        self._select(next(self.iter_enumerate))
+        return self
+
+    def _indices(self) -> range:
+        return self._selected
 
-    return some_info
+
+async def afetch(video_ids: Union[str, List[str]],
+                 dev_key: str = '',
+                 concurrency: int = 8,
+                 client: Optional[googleapiclient.discovery.Resource] = None) -> VideoMetadata:
+    """Looks up the videos with up to `concurrency` requests of 50 ids in flight at once.
+    Requires aiohttp. Sends the same requests as VideoMetadata and shares its response cache.
+    :param video_ids: YouTube ids to look up.
+    :param dev_key: Google Cloud Platform dev key.
+    :param concurrency: Most requests sent at the same time.
+    :param client: Existing Google API client instance, used to build the requests.
+    :raises: ImportError, ValueError, googleapiclient.errors.HttpError
+    """
+    if aiohttp is None:
+        raise ImportError("afetch requires aiohttp, install video_metadata[aio]")
+    if concurrency < 1:
+        raise ValueError("`concurrency` must be at least 1")
+    if client is None:
+        if not dev_key:
+            raise ValueError("`dev_key` or `client` must be specified")
+        client = _get_client(dev_key)
+    if isinstance(video_ids, str):
+        video_ids = [video_ids]
+
+    found, misses = _split_cached(video_ids)
+    if misses:
+        requests = [VideoMetadata._list_request(client, chunk)
+                    for chunk in VideoMetadata._chunked(misses, _MAX_IDS_PER_REQUEST)]
+        # The connector limit bounds how many requests are in flight
+        connector = aiohttp.TCPConnector(limit=concurrency)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            responses = await asyncio.gather(*(_aexecute(session, request) for request in requests))
+        fetched = [item for response in responses for item in response.get("items", [])]
+        _response_cache_put(fetched)
+        found.update((item["id"], item) for item in fetched)
+
+    return VideoMetadata._from_results(client, video_ids, _mark_unavailable_videos(video_ids, list(found.values())))
+
+
+async def _aexecute(session: "aiohttp.ClientSession", request: googleapiclient.http.HttpRequest) -> dict:
+    """Sends a request built by googleapiclient with aiohttp
+    Errors raise HttpError and the body is parsed by the request's own model, as with `execute`"""
+    headers = dict(request.headers)
+    headers["user-agent"] = "{} {}".format(_USER_AGENT, headers.get("user-agent", "")).strip()
+    async with session.request(request.method, request.uri, headers=headers) as response:
+        content = await response.read()
+        resp = httplib2.Response(dict(response.headers, status=str(response.status)))
+    if resp.status >= 300:
+        raise HttpError(resp, content, uri=request.uri)
+    return request.postproc(resp, content)
+
+
+def _mark_unavailable_videos(vids_requested: Union[str, List[str]], vids_result: List[dict]) -> List[Optional[dict]]:
+    """Fills requests with unavailable video ids with None
+    Results are matched by id, so they may be in any order"""
+    if isinstance(vids_requested, str):
+        vids_requested = [vids_requested]
+    by_id = {vid_result["id"]: vid_result for vid_result in vids_result}
+    return [by_id.get(request_yt_id) for request_yt_id in vids_requested]
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+    Canned YouTube data api responses and clients answering with them.
+"""
+
+import json
+
+from googleapiclient.discovery import build_from_document
+from googleapiclient.http import HttpMockSequence
+
+from video_metadata.video_metadata import _discovery_document
+
+BOUNDARY = "batch_boundary"
+
+
+def make_client(responses, **kwargs):
+    """A client answering its requests with `responses` in order, failing on any extra request"""
+    return build_from_document(_discovery_document(), developerKey="key", http=HttpMockSequence(responses),
+                               **kwargs)
+
+
+def video(yt_id, **snippet):
+    snippet.setdefault("title", "title " + yt_id)
+    return {"id": yt_id, "snippet": snippet}
+
+
+def list_response(items):
+    return {"status": "200"}, json.dumps({"items": items})
+
+
+def batch_response(items_by_request_id, statuses=None):
+    """A batch response answering the request ids in reverse order
+    `statuses` overrides the 200 status of some request ids"""
+    statuses = statuses or {}
+    parts = []
+    for request_id, items in reversed(list(items_by_request_id.items())):
+        status = statuses.get(request_id, "200 OK")
+        body = json.dumps({"items": items} if status.startswith("200") else {"error": {"message": status}})
+        parts.append("--{}\r\n"
+                     "Content-Type: application/http\r\n"
+                     "Content-ID: <response-base + {}>\r\n\r\n"
+                     "HTTP/1.1 {}\r\n"
+                     "Content-Type: application/json\r\n\r\n"
+                     "{}\r\n".format(BOUNDARY, request_id, status, body))
+    content = "".join(parts) + "--{}--".format(BOUNDARY)
+    return {"status": "200", "content-type": 'multipart/mixed; boundary="{}"'.format(BOUNDARY)}, content
@@ -1,10 +1,21 @@
 # -*- coding: utf-8 -*-
 """
-    Dummy conftest.py for video_metadata.
+    Fixtures shared by the tests of video_metadata.
 
-    If you don't know what this is for, just leave it empty.
     Read more about conftest.py under:
     https://pytest.org/latest/plugins.html
 """
 
-# import pytest
+import pytest
+
+from video_metadata import clear_cache, configure_cache
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Every test starts and ends with the default cache, empty"""
+    configure_cache()
+    clear_cache()
+    yield
+    clear_cache()
+    configure_cache()
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+import pytest
+from googleapiclient.discovery import build_from_document
+from googleapiclient.errors import HttpError
+
+from video_metadata import afetch
+from video_metadata import video_metadata
+from api_responses import video
+
+web = pytest.importorskip("aiohttp.web")
+
+IDS = ["v{}".format(i) for i in range(120)]
+MISSING = {"v3", "v77"}
+
+
+class FakeApi:
+    """A local videos().list endpoint, slower to answer the earlier chunks"""
+
+    def __init__(self, status=200):
+        self.status = status
+        self.requests = []
+
+    async def videos(self, request):
+        self.requests.append(request)
+        if self.status != 200:
+            return web.json_response({"error": {"message": "denied"}}, status=self.status)
+        ids = request.query["id"].split(",")
+        if ids[0] in IDS:
+            # Earlier chunks answer last
+            await asyncio.sleep(0.01 * (3 - IDS.index(ids[0]) // 50))
+        return web.json_response({"items": [video(i) for i in ids if i not in MISSING]})
+
+    def fetch(self, *args, **kwargs):
+        """Runs afetch against this endpoint, using a client whose requests point at it"""
+        async def main():
+            app = web.Application()
+            app.router.add_get("/youtube/v3/videos", self.videos)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = runner.addresses[0][1]
+            client = build_from_document(video_metadata._discovery_document(), developerKey="key",
+                                         client_options={"api_endpoint": "http://127.0.0.1:{}/".format(port)})
+            try:
+                return await afetch(*args, client=client, **kwargs)
+            finally:
+                await runner.cleanup()
+        return asyncio.run(main())
+
+
+def test_results_follow_request_order():
+    api = FakeApi()
+
+    vm = api.fetch(IDS, concurrency=3)
+
+    assert len(api.requests) == 3
+    assert [v.id for v in vm] == IDS
+    assert [v.available() for v in vm] == [i not in MISSING for i in IDS]
+    assert all(v.title == "title " + v.id for v in vm if v.available())
+
+
+def test_requests_identify_the_package():
+    api = FakeApi()
+    api.fetch("a")
+    assert api.requests[0].headers["User-Agent"].startswith("video_metadata/")
+    assert api.requests[0].query["key"] == "key"
+
+
+def test_cache_hits_send_no_request():
+    FakeApi().fetch(IDS)
+    api = FakeApi()
+
+    vm = api.fetch(["v5", "v3", "v6"])
+
+    # Only the unavailable video, never cached, is looked up again
+    assert [request.query["id"] for request in api.requests] == ["v3"]
+    assert [v.available() for v in vm] == [True, False, True]
+
+
+def test_error_status_raises_http_error():
+    with pytest.raises(HttpError) as error:
+        FakeApi(status=403).fetch(["a"])
+    assert error.value.resp.status == 403
+
+
+def test_requires_aiohttp(monkeypatch):
+    monkeypatch.setattr(video_metadata, "aiohttp", None)
+    with pytest.raises(ImportError):
+        asyncio.run(afetch(["a"], dev_key="key"))
+
+
+def test_rejects_bad_arguments():
+    with pytest.raises(ValueError):
+        asyncio.run(afetch(["a"], dev_key="key", concurrency=0))
+    with pytest.raises(ValueError):
+        asyncio.run(afetch(["a"]))
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from video_metadata import VideoMetadata
+from video_metadata import video_metadata
+from api_responses import batch_response, list_response, make_client, video
+
+IDS = ["v{}".format(i) for i in range(120)]
+MISSING = {"v3", "v77"}
+CHUNKS = [IDS[:50], IDS[50:100], IDS[100:]]
+
+
+def chunk_items(chunk):
+    return [video(i) for i in chunk if i not in MISSING]
+
+
+def test_up_to_50_ids_skip_the_batch():
+    vm = VideoMetadata(["a", "b"], client=make_client([list_response([video("a", categoryId="10")])]))
+    assert len(vm) == 2
+    assert vm.available()
+    assert (vm.id, vm.title, vm.category_name) == ("a", "title a", "Music")
+    assert [v.available() for v in vm] == [True, False]
+
+
+def test_over_50_ids_are_one_batch():
+    # Only one response is available, a second HTTP request would fail
+    client = make_client([batch_response({str(i): chunk_items(chunk) for i, chunk in enumerate(CHUNKS)})])
+
+    vm = VideoMetadata(IDS, client=client)
+
+    assert [v.id for v in vm] == IDS
+    assert [v.available() for v in vm] == [i not in MISSING for i in IDS]
+    assert all(v.title == "title " + v.id for v in vm if v.available())
+
+
+def test_batches_are_split_at_the_batch_limit(monkeypatch):
+    monkeypatch.setattr(video_metadata, "_MAX_REQUESTS_PER_BATCH", 2)
+    client = make_client([batch_response({"0": chunk_items(CHUNKS[0]), "1": chunk_items(CHUNKS[1])}),
+                          batch_response({"2": chunk_items(CHUNKS[2])})])
+
+    vm = VideoMetadata(IDS, client=client)
+
+    assert [v.available() for v in vm] == [i not in MISSING for i in IDS]
+
+
+def test_failed_batch_request_raises():
+    client = make_client([batch_response({str(i): chunk_items(chunk) for i, chunk in enumerate(CHUNKS)},
+                                         statuses={"1": "403 Forbidden"})])
+    with pytest.raises(HttpError):
+        VideoMetadata(IDS, client=client)
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from video_metadata import VideoMetadata, clear_cache, configure_cache
+from video_metadata import video_metadata
+from api_responses import list_response, make_client, video
+
+
+def test_cache_hits_skip_http():
+    VideoMetadata(["a", "b"], client=make_client([list_response([video("a"), video("b")])]))
+
+    vm = VideoMetadata(["b", "a"], client=make_client([]))
+
+    assert [v.title for v in vm] == ["title b", "title a"]
+
+
+def test_cache_misses_are_fetched():
+    VideoMetadata("a", client=make_client([list_response([video("a")])]))
+
+    vm = VideoMetadata(["a", "b"], client=make_client([list_response([video("b")])]))
+
+    assert [v.title for v in vm] == ["title a", "title b"]
+
+
+def test_unavailable_videos_are_not_cached():
+    VideoMetadata("a", client=make_client([list_response([])]))
+
+    vm = VideoMetadata("a", client=make_client([list_response([video("a")])]))
+
+    assert vm.available()
+
+
+def test_cached_results_are_copies():
+    vm = VideoMetadata("a", client=make_client([list_response([video("a", tags=["x"])])]))
+    vm.keywords.append("y")
+    vm.current_item["snippet"]["title"] = "changed"
+
+    again = VideoMetadata("a", client=make_client([]))
+    again.keywords.append("z")
+
+    assert VideoMetadata("a", client=make_client([])).keywords == ["x"]
+    assert again.title == "title a"
+
+
+def test_clear_cache_forces_a_lookup():
+    VideoMetadata("a", client=make_client([list_response([video("a")])]))
+    clear_cache()
+
+    vm = VideoMetadata("a", client=make_client([list_response([video("a", title="new")])]))
+
+    assert vm.title == "new"
+
+
+def test_least_recently_used_are_evicted():
+    configure_cache(size=2)
+    VideoMetadata(["a", "b"], client=make_client([list_response([video("a"), video("b")])]))
+    VideoMetadata("a", client=make_client([]))
+    VideoMetadata("c", client=make_client([list_response([video("c")])]))
+
+    assert list(video_metadata._response_cache) == ["a", "c"]
+
+
+def test_size_0_disables_the_cache():
+    configure_cache(size=0)
+    VideoMetadata("a", client=make_client([list_response([video("a")])]))
+
+    assert len(video_metadata._response_cache) == 0
+
+
+def test_negative_size_is_rejected():
+    with pytest.raises(ValueError):
+        configure_cache(size=-1)
+
+
+def test_memory_entries_expire(monkeypatch):
+    configure_cache(expire=60)
+    now = 1000.0
+    monkeypatch.setattr(video_metadata.time, "time", lambda: now)
+    VideoMetadata("a", client=make_client([list_response([video("a")])]))
+
+    now += 61
+    vm = VideoMetadata("a", client=make_client([list_response([video("a", title="new")])]))
+
+    assert vm.title == "new"
+
+
+def test_disk_is_not_used_by_default():
+    VideoMetadata("a", client=make_client([list_response([video("a")])]))
+    assert video_metadata._disk_cache is None
+
+
+def test_disk_cache_requires_diskcache(monkeypatch, tmp_path):
+    monkeypatch.setattr(video_metadata, "diskcache", None)
+    with pytest.raises(ImportError):
+        configure_cache(directory=str(tmp_path))
+
+
+@pytest.fixture
+def disk_cache(tmp_path):
+    pytest.importorskip("diskcache")
+    configure_cache(directory=str(tmp_path), expire=60)
+    return video_metadata._disk_cache
+
+
+def test_disk_entries_survive_the_memory_cache(disk_cache, tmp_path):
+    VideoMetadata("a", client=make_client([list_response([video("a")])]))
+    # A new run starts with an empty memory cache and reopens the directory
+    configure_cache(directory=str(tmp_path), expire=60)
+    video_metadata._response_cache.clear()
+
+    vm = VideoMetadata("a", client=make_client([]))
+
+    assert vm.title == "title a"
+
+
+def test_disk_entries_are_promoted_with_their_expiry(disk_cache):
+    VideoMetadata("a", client=make_client([list_response([video("a")])]))
+    video_metadata._response_cache.clear()
+
+    VideoMetadata("a", client=make_client([]))
+
+    _, disk_expires_at = disk_cache.get("a", expire_time=True)
+    _, memory_expires_at = video_metadata._response_cache["a"]
+    assert memory_expires_at == disk_expires_at
+
+
+def test_clear_cache_wipes_the_disk(disk_cache):
+    VideoMetadata("a", client=make_client([list_response([video("a")])]))
+    assert "a" in disk_cache
+
+    clear_cache()
+
+    assert "a" not in disk_cache
+    vm = VideoMetadata("a", client=make_client([list_response([video("a", title="new")])]))
+    assert vm.title == "new"
+
+
+def test_disk_can_be_turned_off(disk_cache):
+    configure_cache(directory=None)
+    VideoMetadata("a", client=make_client([list_response([video("a")])]))
+
+    assert video_metadata._disk_cache is None
+    assert len(disk_cache) == 0
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+import threading
+
+import pytest
+
+from video_metadata import VideoMetadata
+from video_metadata import video_metadata
+from api_responses import list_response, make_client, video
+
+
+@pytest.fixture(autouse=True)
+def no_shared_clients(monkeypatch):
+    monkeypatch.setattr(video_metadata, "_CLIENTS", {})
+    monkeypatch.setattr(video_metadata, "_transports", threading.local())
+
+
+def in_thread(function):
+    result = []
+    thread = threading.Thread(target=lambda: result.append(function()))
+    thread.start()
+    thread.join()
+    return result[0]
+
+
+def test_threads_share_one_client_per_dev_key():
+    client = video_metadata._get_client("key")
+    assert in_thread(lambda: video_metadata._get_client("key")) is client
+    assert video_metadata._get_client("other key") is not client
+
+
+def test_threads_have_their_own_transport():
+    client = video_metadata._get_client("key")
+    http = video_metadata._thread_http(client)
+    assert video_metadata._thread_http(client) is http
+    assert in_thread(lambda: video_metadata._thread_http(client)) is not http
+
+
+def test_transport_keeps_build_http_defaults():
+    http = video_metadata._thread_http(video_metadata._get_client("key"))
+    assert http.timeout is not None
+    assert 308 not in http.redirect_codes
+
+
+def test_given_clients_keep_their_transport():
+    assert video_metadata._thread_http(make_client([])) is None
+
+
+def test_shared_client_sends_over_thread_transport(monkeypatch):
+    client = video_metadata._get_client("key")
+    monkeypatch.setattr(video_metadata, "_new_http", lambda: make_client([list_response([video("a")])])._http)
+
+    vm = VideoMetadata("a", dev_key="key")
+
+    assert vm.client is client
+    assert vm.title == "title a"
+
+
+def test_preload_builds_the_clients_every_thread_uses():
+    video_metadata.preload(["key", "other key"])
+
+    clients = dict(video_metadata._CLIENTS)
+
+    assert set(clients) == {"key", "other key"}
+    assert in_thread(lambda: video_metadata._get_client("key")) is clients["key"]
+    assert video_metadata._CLIENTS == clients
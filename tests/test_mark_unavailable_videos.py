@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+
+from video_metadata.video_metadata import _mark_unavailable_videos
+from api_responses import video
+
+
+def test_mark_unavailable_videos_missing_and_out_of_order():
+    results = [video("c"), video("a")]
+    marked = _mark_unavailable_videos(["a", "b", "c", "d"], results)
+    assert marked == [results[1], None, results[0], None]
+
+
+def test_mark_unavailable_videos_single_id():
+    assert _mark_unavailable_videos("a", []) == [None]
+    assert _mark_unavailable_videos("a", [video("a")]) == [video("a")]
+
+
+def test_mark_unavailable_videos_no_results():
+    assert _mark_unavailable_videos(["a", "b"], []) == [None, None]
+
+
+def test_mark_unavailable_videos_repeated_id():
+    assert _mark_unavailable_videos(["a", "b", "a"], [video("a")]) == [video("a"), None, video("a")]
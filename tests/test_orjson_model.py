@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from video_metadata import VideoMetadata
+from video_metadata import video_metadata
+from video_metadata.video_metadata import _OrjsonModel
+from api_responses import batch_response, list_response, make_client, video
+
+pytest.importorskip("orjson")
+
+
+def test_parses_json():
+    assert _OrjsonModel().deserialize(b'{"items": [{"id": "a"}]}') == {"items": [{"id": "a"}]}
+
+
+def test_returns_non_json_bodies_as_is():
+    assert _OrjsonModel().deserialize(b"Not Found") == "Not Found"
+
+
+def test_unwraps_data_wrapper():
+    assert _OrjsonModel(data_wrapper=True).deserialize(b'{"data": {"id": "a"}}') == {"id": "a"}
+    assert _OrjsonModel().deserialize(b'{"data": {"id": "a"}}') == {"data": {"id": "a"}}
+
+
+def test_shared_clients_use_orjson(monkeypatch):
+    monkeypatch.setattr(video_metadata, "_CLIENTS", {})
+    assert isinstance(video_metadata._get_client("key")._model, _OrjsonModel)
+
+
+def test_single_lookup():
+    client = make_client([list_response([video("a")])], model=_OrjsonModel())
+
+    assert VideoMetadata(["a", "b"], client=client).title == "title a"
+
+
+def test_batch_lookup():
+    ids = ["v{}".format(i) for i in range(60)]
+    client = make_client([batch_response({"0": [video(i) for i in ids[:50]], "1": [video(ids[55])]})],
+                         model=_OrjsonModel())
+
+    vm = VideoMetadata(ids, client=client)
+
+    assert [v.id for v in vm if v.available()] == ids[:50] + [ids[55]]
+    assert vm[55].title == "title v55"
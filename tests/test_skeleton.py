@@ -1,4 +0,0 @@
-# -*- coding: utf-8 -*-
-
-import pytest
-from video_metadata import VideoMetaData
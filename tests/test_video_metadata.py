@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from video_metadata import VideoMetadata
+from api_responses import list_response, make_client, video
+
+
+def test_requires_dev_key_or_client():
+    with pytest.raises(ValueError):
+        VideoMetadata("a")
+
+
+def properties(vm):
+    return (vm.title, vm.description, vm.channel_id, vm.channel_title, vm.keywords, vm.time_published,
+            vm.category_id, vm.category_name)
+
+
+def test_properties():
+    snippet = {"title": "title a", "description": "about a", "channelId": "channel", "channelTitle": "Channel",
+               "tags": ["x", "y"], "publishedAt": "2020-01-01T00:00:00Z", "categoryId": "27"}
+    vm = VideoMetadata("a", client=make_client([list_response([video("a", **snippet)])]))
+    assert properties(vm) == ("title a", "about a", "channel", "Channel", ["x", "y"], "2020-01-01T00:00:00Z",
+                              "27", "Education")
+
+
+def test_missing_fields_defaults():
+    vm = VideoMetadata("a", client=make_client([list_response([{"id": "a", "snippet": {"categoryId": "999"}}])]))
+    assert vm.available()
+    assert properties(vm) == ("", "", "", "", [], "", "999", "")
+
+
+def test_unavailable_video_defaults():
+    vm = VideoMetadata("a", client=make_client([list_response([])]))
+    assert not vm.available()
+    assert properties(vm) == ("", "", "", "", [], "", "", "")
+
+
+@pytest.fixture
+def five_videos():
+    ids = ["a", "b", "c", "d", "e"]
+    return VideoMetadata(ids, client=make_client([list_response([video(i) for i in ids if i != "c"])]))
+
+
+def test_views_slice_chains_and_negative_steps(five_videos):
+    view = five_videos[1:][::-1]
+    assert view.id == "e"
+    assert [v.id for v in view] == ["e", "d", "c", "b"]
+    assert [v.available() for v in view] == [True, True, False, True]
+    assert [v.id for v in view[1:3]] == ["d", "c"]
+    assert [v.id for v in five_videos[::-2][1:]] == ["c", "a"]
+    assert len(five_videos[10:]) == 0
+
+
+def test_views_share_results(five_videos):
+    view = five_videos[1:3]
+    assert view._multi_metadata is five_videos._multi_metadata
+
+    copied = view.copy()
+    assert type(copied) is VideoMetadata
+    assert copied._multi_metadata is not five_videos._multi_metadata
+    assert [v.id for v in copied] == ["b", "c"]
+
+
+def test_index_returns_single_video(five_videos):
+    assert five_videos[-1].id == "e"
+    assert len(five_videos[1]) == 1
+    assert five_videos[1][0].title == "title b"
+    with pytest.raises(IndexError):
+        five_videos[5]
+
+
+def test_to_dataframe_of_view(five_videos):
+    pytest.importorskip("pandas")
+    df = five_videos[::-1][:3].to_dataframe()
+    assert list(df["id"]) == ["e", "d", "c"]
+    assert list(df["available"]) == [True, True, False]
+    assert list(df["title"]) == ["title e", "title d", ""]
+    assert list(df["category_name"]) == ["", "", ""]
+
+
+def test_to_dataframe_matches_properties():
+    pytest.importorskip("pandas")
+    items = [video("a", description="about a", channelId="channel", channelTitle="Channel", tags=["x"],
+                   publishedAt="2020-01-01T00:00:00Z", categoryId="10"),
+             video("c", categoryId="999")]
+    vm = VideoMetadata(["a", "b", "c"], client=make_client([list_response(items)]))
+
+    rows = vm.to_dataframe().to_dict("records")
+
+    assert rows == [{"id": v.id, "available": v.available(), "title": v.title, "description": v.description,
+                     "channel_id": v.channel_id, "channel_title": v.channel_title, "keywords": v.keywords,
+                     "time_published": v.time_published, "category_id": v.category_id,
+                     "category_name": v.category_name} for v in vm]
+    assert rows[0]["category_name"] == "Music"
+
+
+def test_to_dataframe_of_empty_view(five_videos):
+    pytest.importorskip("pandas")
+    df = five_videos[10:].to_dataframe()
+    assert len(df) == 0
+    assert "category_name" in df.columns